@@ -13,8 +13,9 @@ from rich.console import Console
 from rich.table import Table
 from rich import print as rprint
 
-from core.vector_store import VectorStore
-from core.knowledge_base import KnowledgeBase
+# core.vector_store and core.knowledge_base pull in chromadb, PyMuPDF,
+# tiktoken and sentence-transformers, so they are imported inside the
+# helpers below to keep `--help` fast
 
 
 # Load environment variables
@@ -26,11 +27,20 @@ console = Console()
 def get_vector_store():
     """Initialize and return vector store instance"""
     try:
-        vector_store = VectorStore(
-            collection_name="note2agent_docs",
-            chromadb_host="localhost",
-            chromadb_port=8000
-        )
+        # N2A_VECTOR_BACKEND=usearch swaps ChromaDB for the local HNSW index
+        if os.environ.get("N2A_VECTOR_BACKEND", "chroma").lower() == "usearch":
+            from core.usearch_store import USearchStore
+            vector_store = USearchStore(
+                collection_name="note2agent_docs",
+                quantization=os.environ.get("N2A_USEARCH_QUANTIZATION", "int8")
+            )
+        else:
+            from core.vector_store import VectorStore
+            vector_store = VectorStore(
+                collection_name="note2agent_docs",
+                chromadb_host="localhost",
+                chromadb_port=8000
+            )
 
         # Health check
         if not vector_store.health_check():
@@ -48,6 +58,8 @@ def get_vector_store():
 
 def get_knowledge_base():
     """Initialize and return knowledge base instance"""
+    from core.knowledge_base import KnowledgeBase
+
     vector_store = get_vector_store()
     return KnowledgeBase(vector_store)
 
@@ -117,11 +129,17 @@ def status():
     # List indexed files
     files = kb.list_indexed_files()
     if files:
-        console.print("\n[bold]Indexed Files:[/bold]")
+        # One table renders in a single pass instead of a print per file
+        files_table = Table(title="Indexed Files")
+        files_table.add_column("File", style="cyan")
+        files_table.add_column("Chunks", justify="right")
+
         for file_info in files:
-            file_path = file_info['path']
-            file_name = os.path.basename(file_path)
-            console.print(f"  • [cyan]{file_name}[/cyan] ({file_info['chunks']} chunks)")
+            file_name = os.path.basename(file_info['path'])
+            files_table.add_row(file_name, str(file_info['chunks']))
+
+        console.print()
+        console.print(files_table)
 
     console.print()
 
@@ -0,0 +1,111 @@
+"""
+Chunk Cache
+
+On-disk cache of processed chunks keyed by file hash.
+Lets refreshes skip PDF parsing and tokenization for content seen before.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import List, Dict, Optional
+
+try:
+    import zstandard
+except ImportError:  # zstandard is optional; the cache is disabled without it
+    zstandard = None
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to stdlib json
+    orjson = None
+
+
+class ChunkCache:
+    """
+    Stores chunk lists as zstd-compressed JSON files.
+
+    Layout: {cache_dir}/{file_hash[:2]}/{file_hash}_{config}.zst, where
+    config identifies the chunking settings that produced the chunks.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str = "./.cache/chunks",
+        compression_level: int = 3
+    ):
+        """
+        Initialize chunk cache.
+
+        Args:
+            cache_dir: Directory holding cached chunk files
+            compression_level: zstd compression level
+        """
+        self.cache_dir = Path(cache_dir)
+        self.compression_level = compression_level
+
+    @property
+    def enabled(self) -> bool:
+        """True if zstandard is installed."""
+        return zstandard is not None
+
+    def get(self, file_hash: str, config: str) -> Optional[List[Dict]]:
+        """
+        Load cached chunks for a file.
+
+        Args:
+            file_hash: File content hash
+            config: Chunking settings identifier
+
+        Returns:
+            List of chunks, or None on a cache miss
+        """
+        if not self.enabled:
+            return None
+
+        path = self._path(file_hash, config)
+        if not path.exists():
+            return None
+
+        try:
+            data = zstandard.ZstdDecompressor().decompress(path.read_bytes())
+            return orjson.loads(data) if orjson else json.loads(data)
+        except Exception as e:
+            print(f"Warning: Could not read chunk cache {path.name}: {e}")
+            return None
+
+    def put(self, file_hash: str, config: str, chunks: List[Dict]) -> None:
+        """
+        Store chunks for a file.
+
+        Args:
+            file_hash: File content hash
+            config: Chunking settings identifier
+            chunks: Chunks to cache
+        """
+        if not self.enabled:
+            return
+
+        path = self._path(file_hash, config)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        data = orjson.dumps(chunks) if orjson else json.dumps(chunks).encode("utf-8")
+        compressed = zstandard.ZstdCompressor(level=self.compression_level).compress(data)
+
+        # Write to a temp file and rename so readers never see a partial file
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(compressed)
+        os.replace(tmp, path)
+
+    def _path(self, file_hash: str, config: str) -> Path:
+        """
+        Build the cache file path for a file hash.
+
+        Args:
+            file_hash: File content hash
+            config: Chunking settings identifier
+
+        Returns:
+            Path to the cache file
+        """
+        return self.cache_dir / file_hash[:2] / f"{file_hash}_{config}.zst"
@@ -0,0 +1,76 @@
+"""
+Distance Kernels
+
+Exact cosine scoring used to re-rank approximate vector search candidates.
+Uses a Numba-compiled SIMD kernel when numba is installed, numpy otherwise.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional
+    njit = None
+
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _cosine_scores(q, db):
+        n, d = db.shape
+
+        q_norm = 0.0
+        for j in range(d):
+            q_norm += q[j] * q[j]
+        q_norm = np.sqrt(q_norm) or 1.0
+
+        scores = np.empty(n, dtype=np.float32)
+        for i in prange(n):
+            dot = 0.0
+            norm = 0.0
+            for j in range(d):
+                dot += q[j] * db[i, j]
+                norm += db[i, j] * db[i, j]
+            scores[i] = dot / ((np.sqrt(norm) or 1.0) * q_norm)
+
+        return scores
+else:
+    def _cosine_scores(q, db):
+        q_norm = np.linalg.norm(q) or 1.0
+        db_norms = np.linalg.norm(db, axis=1)
+        db_norms[db_norms == 0] = 1.0
+
+        return (db @ q) / (db_norms * q_norm)
+
+
+def cosine_topk(
+    q: np.ndarray,
+    db: np.ndarray,
+    k: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Find the k rows of db most similar to q by cosine similarity.
+
+    Args:
+        q: Query vector, shape (d,)
+        db: Candidate vectors, shape (n, d)
+        k: Number of results
+
+    Returns:
+        Tuple of (indices, scores), sorted by descending similarity
+    """
+    q = np.ascontiguousarray(q, dtype=np.float32)
+    db = np.ascontiguousarray(db, dtype=np.float32)
+
+    scores = _cosine_scores(q, db)
+
+    k = min(k, len(scores))
+    if k <= 0:
+        return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.float32)
+
+    # Partial selection, then sort only the winners
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+
+    return idx, scores[idx]
@@ -6,14 +6,79 @@ Extracts text, metadata, and prepares chunks for embedding.
 """
 
 import os
+import bisect
 import hashlib
+import mmap
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
-import fitz  # PyMuPDF
-import tiktoken
+# fitz (PyMuPDF) and tiktoken are imported where they are used so that
+# importing this module stays cheap
+if TYPE_CHECKING:
+    import tiktoken
+
+
+# PDFs with more pages than this have their text extracted in parallel
+PARALLEL_PAGE_THRESHOLD = 64
+
+# File extensions DocumentProcessor can handle
+SUPPORTED_EXTENSIONS = (".pdf", ".md", ".markdown", ".txt")
+
+# Loaded tokenizer encodings, shared by every processor in the process
+_ENCODINGS: Dict[str, "tiktoken.Encoding"] = {}
+
+
+def _get_encoding(encoding_name: str) -> "tiktoken.Encoding":
+    """
+    Load a tiktoken encoding once per process.
+
+    Args:
+        encoding_name: Tokenizer encoding name
+
+    Returns:
+        Cached tiktoken Encoding
+    """
+    encoding = _ENCODINGS.get(encoding_name)
+    if encoding is None:
+        import tiktoken
+
+        encoding = _ENCODINGS[encoding_name] = tiktoken.get_encoding(encoding_name)
+
+    return encoding
+
+
+def _extract_pages(file_path: str, start: int, end: int) -> List[tuple]:
+    """
+    Extract text from a range of PDF pages.
+
+    Opens its own document handle so it can run in a worker process.
+
+    Args:
+        file_path: Path to PDF file
+        start: First page (0-indexed, inclusive)
+        end: Last page (0-indexed, exclusive)
+
+    Returns:
+        List of (page_num, text) tuples for non-empty pages
+    """
+    import fitz  # PyMuPDF
+
+    pages = []
+
+    with fitz.open(file_path) as doc:
+        for page_num in range(start, end):
+            # Get page (0-indexed in PyMuPDF) and extract its text
+            text = doc[page_num].get_text()
+
+            if not text or not text.strip():
+                continue
+
+            pages.append((page_num, text))
+
+    return pages
 
 
 class DocumentProcessor:
@@ -31,7 +96,8 @@ class DocumentProcessor:
         self,
         chunk_size: int = 512,
         chunk_overlap: int = 50,
-        encoding_name: str = "cl100k_base"
+        encoding_name: str = "cl100k_base",
+        page_workers: Optional[int] = None
     ):
         """
         Initialize document processor.
@@ -40,10 +106,19 @@ class DocumentProcessor:
             chunk_size: Maximum tokens per chunk
             chunk_overlap: Overlap tokens between chunks
             encoding_name: Tokenizer encoding (default for Claude/GPT-4)
+            page_workers: Processes for large-PDF page extraction
+                (defaults to CPU count, 1 disables)
         """
+        if chunk_overlap >= chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+
         self.chunk_size = chunk_size
         self.chunk_overlap = chunk_overlap
-        self.encoding = tiktoken.get_encoding(encoding_name)
+        self.page_workers = page_workers or os.cpu_count() or 1
+        self.encoding = _get_encoding(encoding_name)
+
+        # path -> (mtime_ns, size, hash) so unchanged files are not re-read
+        self._hash_cache: Dict[str, tuple] = {}
 
     def process_file(self, file_path: str) -> List[Dict]:
         """
@@ -55,6 +130,21 @@ class DocumentProcessor:
         Returns:
             List of chunk dictionaries with text and metadata
 
+        Raises:
+            ValueError: If file type not supported
+        """
+        return list(self.iter_chunks(file_path))
+
+    def iter_chunks(self, file_path: str) -> Iterator[Dict]:
+        """
+        Process a single file, yielding chunks with metadata one at a time.
+
+        Args:
+            file_path: Path to the file
+
+        Yields:
+            Chunk dictionaries with text and metadata
+
         Raises:
             ValueError: If file type not supported
         """
@@ -67,108 +157,160 @@ class DocumentProcessor:
         extension = path.suffix.lower()
 
         if extension == ".pdf":
-            return self._process_pdf(path)
+            yield from self._process_pdf(path)
         elif extension in [".md", ".markdown", ".txt"]:
-            return self._process_markdown(path)
+            yield from self._process_markdown(path)
         else:
             raise ValueError(f"Unsupported file type: {extension}")
 
-    def _process_pdf(self, file_path: Path) -> List[Dict]:
+    def _process_pdf(self, file_path: Path) -> Iterator[Dict]:
         """
         Extract text from PDF and create chunks using PyMuPDF.
 
         Args:
             file_path: Path to PDF file
 
-        Returns:
-            List of chunks with metadata
+        Yields:
+            Chunks with metadata
         """
-        chunks = []
+        import fitz  # PyMuPDF
 
         try:
-            # Open PDF with PyMuPDF
-            doc = fitz.open(str(file_path))
-            total_pages = len(doc)
-
-            for page_num in range(total_pages):
-                # Get page (0-indexed in PyMuPDF)
-                page = doc[page_num]
-
-                # Extract text from page
-                text = page.get_text()
-
-                if not text or not text.strip():
-                    continue
-
-                # Create chunks from page text
-                page_chunks = self._chunk_text(text)
-
-                # Add metadata to each chunk
-                for chunk_idx, chunk_text in enumerate(page_chunks):
-                    chunks.append({
-                        "text": chunk_text,
-                        "metadata": {
-                            "source": file_path.name,
-                            "file_path": str(file_path.absolute()),
-                            "file_type": "pdf",
-                            "page": page_num + 1,  # 1-indexed for user display
-                            "total_pages": total_pages,
-                            "chunk_index": chunk_idx,
-                            "timestamp": datetime.now().isoformat(),
-                            "file_hash": self._compute_file_hash(file_path)
-                        }
-                    })
-
-            # Close the PDF document
-            doc.close()
+            # Open PDF with PyMuPDF just to count pages
+            with fitz.open(str(file_path)) as doc:
+                total_pages = len(doc)
+
+            # Collect non-empty pages as (page_num, text)
+            if total_pages > PARALLEL_PAGE_THRESHOLD and self.page_workers > 1:
+                pages = self._extract_pages_parallel(file_path, total_pages)
+            else:
+                pages = _extract_pages(str(file_path), 0, total_pages)
+
+            if not pages:
+                return
+
+            # Encode all pages in one batch call and record where each page
+            # starts in the concatenated token stream
+            page_tokens = self.encoding.encode_ordinary_batch(
+                [text for _, text in pages]
+            )
+            tokens = []
+            page_offsets = []
+            for page_toks in page_tokens:
+                page_offsets.append(len(tokens))
+                tokens.extend(page_toks)
+
+            # Chunk the whole document once and decode all windows together
+            windows = self._chunk_tokens(tokens)
+            chunk_texts = self.encoding.decode_batch(windows)
+            stride = self.chunk_size - self.chunk_overlap
+
+            # Hash and timestamp once per file rather than once per chunk
+            file_hash = self._compute_file_hash(file_path)
+            timestamp = datetime.now().isoformat()
+
+            # Add metadata to each chunk
+            for chunk_idx, chunk_text in enumerate(chunk_texts):
+                # Map the chunk's first token back to the page it came from
+                start = chunk_idx * stride
+                page_num = pages[bisect.bisect_right(page_offsets, start) - 1][0]
+
+                yield {
+                    "text": chunk_text,
+                    "metadata": {
+                        "source": file_path.name,
+                        "file_path": str(file_path.absolute()),
+                        "file_type": "pdf",
+                        "page": page_num + 1,  # 1-indexed for user display
+                        "total_pages": total_pages,
+                        "chunk_index": chunk_idx,
+                        "timestamp": timestamp,
+                        "file_hash": file_hash
+                    }
+                }
 
         except Exception as e:
             raise RuntimeError(f"Error processing PDF {file_path}: {str(e)}")
 
-        return chunks
+    def _extract_pages_parallel(self, file_path: Path, total_pages: int) -> List[tuple]:
+        """
+        Extract PDF page text by splitting the page range across processes.
+
+        Args:
+            file_path: Path to PDF file
+            total_pages: Number of pages in the PDF
 
-    def _process_markdown(self, file_path: Path) -> List[Dict]:
+        Returns:
+            List of (page_num, text) tuples in page order
+        """
+        slab = -(-total_pages // self.page_workers)  # ceil division
+        ranges = [
+            (start, min(start + slab, total_pages))
+            for start in range(0, total_pages, slab)
+        ]
+
+        pages = []
+        with ProcessPoolExecutor(max_workers=len(ranges)) as executor:
+            # map preserves slab order, so pages stay sorted
+            for slab_pages in executor.map(
+                _extract_pages,
+                [str(file_path)] * len(ranges),
+                [start for start, _ in ranges],
+                [end for _, end in ranges]
+            ):
+                pages.extend(slab_pages)
+
+        return pages
+
+    def _process_markdown(self, file_path: Path) -> Iterator[Dict]:
         """
         Extract text from Markdown/text file and create chunks.
 
         Args:
             file_path: Path to markdown file
 
-        Returns:
-            List of chunks with metadata
+        Yields:
+            Chunks with metadata
         """
-        chunks = []
-
         try:
-            # Read file content
-            with open(file_path, 'r', encoding='utf-8') as f:
-                text = f.read()
+            # Read file content, decoding straight from the mapped pages
+            text = ""
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        text = str(mm, 'utf-8', 'replace')
+
+            # Match text-mode newline handling
+            if "\r" in text:
+                text = text.replace("\r\n", "\n").replace("\r", "\n")
 
             if not text.strip():
-                return chunks
+                return
 
             # Create chunks from text
             text_chunks = self._chunk_text(text)
 
+            # Hash and timestamp once per file rather than once per chunk
+            file_hash = self._compute_file_hash(file_path)
+            timestamp = datetime.now().isoformat()
+
             # Add metadata to each chunk
             for chunk_idx, chunk_text in enumerate(text_chunks):
-                chunks.append({
+                yield {
                     "text": chunk_text,
                     "metadata": {
                         "source": file_path.name,
                         "file_path": str(file_path.absolute()),
                         "file_type": file_path.suffix[1:],  # Remove dot
                         "chunk_index": chunk_idx,
-                        "timestamp": datetime.now().isoformat(),
-                        "file_hash": self._compute_file_hash(file_path)
+                        "timestamp": timestamp,
+                        "file_hash": file_hash
                     }
-                })
+                }
 
         except Exception as e:
             raise RuntimeError(f"Error processing file {file_path}: {str(e)}")
 
-        return chunks
-
     def _chunk_text(self, text: str) -> List[str]:
         """
         Split text into chunks based on token count with overlap.
@@ -179,25 +321,28 @@ class DocumentProcessor:
         Returns:
             List of text chunks
         """
-        # Encode text to tokens
-        tokens = self.encoding.encode(text)
+        # Encode text to tokens once, then decode all windows in one batch
+        tokens = self.encoding.encode_ordinary(text)
 
-        chunks = []
-        start = 0
+        return self.encoding.decode_batch(self._chunk_tokens(tokens))
 
-        while start < len(tokens):
-            # Get chunk of tokens
-            end = start + self.chunk_size
-            chunk_tokens = tokens[start:end]
+    def _chunk_tokens(self, tokens: List[int]) -> List[List[int]]:
+        """
+        Split a token sequence into overlapping windows.
 
-            # Decode back to text
-            chunk_text = self.encoding.decode(chunk_tokens)
-            chunks.append(chunk_text)
+        Args:
+            tokens: Token ids to split
 
-            # Move start position with overlap
-            start += self.chunk_size - self.chunk_overlap
+        Returns:
+            List of token windows
+        """
+        # Window starts advance by the stride; slicing happens in one pass
+        stride = self.chunk_size - self.chunk_overlap
 
-        return chunks
+        return [
+            tokens[start:start + self.chunk_size]
+            for start in range(0, len(tokens), stride)
+        ]
 
     def _compute_file_hash(self, file_path: Path) -> str:
         """
@@ -209,14 +354,26 @@ class DocumentProcessor:
         Returns:
             Hex digest of file hash
         """
-        sha256_hash = hashlib.sha256()
+        stat = os.stat(file_path)
+        cache_key = str(file_path)
+
+        cached = self._hash_cache.get(cache_key)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            return cached[2]
 
         with open(file_path, "rb") as f:
-            # Read file in chunks to handle large files
-            for byte_block in iter(lambda: f.read(4096), b""):
-                sha256_hash.update(byte_block)
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: hashes in C straight from the file descriptor
+                file_hash = hashlib.file_digest(f, "sha256").hexdigest()
+            else:
+                sha256_hash = hashlib.sha256()
+                for byte_block in iter(lambda: f.read(1024 * 1024), b""):
+                    sha256_hash.update(byte_block)
+                file_hash = sha256_hash.hexdigest()
+
+        self._hash_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, file_hash)
 
-        return sha256_hash.hexdigest()
+        return file_hash
 
     def count_tokens(self, text: str) -> int:
         """
@@ -233,23 +390,91 @@ class DocumentProcessor:
 
 # Utility functions
 
+def walk_supported_files(directory: str) -> Iterator[str]:
+    """
+    Yield paths of supported files under a directory, recursively.
+
+    Uses os.scandir with an explicit stack: entry types come from the
+    directory listing instead of a stat call per entry, extensions are
+    checked on the name first, and deep trees cannot hit the recursion limit.
+
+    Args:
+        directory: Directory to walk
+
+    Yields:
+        Paths of supported files
+    """
+    stack = [directory]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif entry.name.lower().endswith(SUPPORTED_EXTENSIONS) and entry.is_file():
+                        yield entry.path
+        except PermissionError:
+            # Skip unreadable directories, like Path.rglob does
+            continue
+
+
+def _process_one(
+    file_path: str,
+    chunk_size: int,
+    chunk_overlap: int,
+    encoding_name: str,
+    known_hash: Optional[Tuple[int, int, str]] = None
+) -> List[Dict]:
+    """
+    Process a single file in a worker process.
+
+    The processor is built inside the worker so only plain arguments
+    need to be pickled.
+
+    Args:
+        file_path: Path to the file
+        chunk_size: Maximum tokens per chunk
+        chunk_overlap: Overlap tokens between chunks
+        encoding_name: Tokenizer encoding
+        known_hash: (mtime_ns, size, hash) already computed by the caller;
+            still checked against the file's stat before use
+
+    Returns:
+        List of chunk dictionaries with text and metadata
+    """
+    # Files are already spread across processes, so extract pages serially
+    processor = DocumentProcessor(
+        chunk_size, chunk_overlap, encoding_name, page_workers=1
+    )
+    if known_hash is not None:
+        processor._hash_cache[file_path] = known_hash
+
+    return processor.process_file(file_path)
+
+
 def process_directory(
     directory_path: str,
     chunk_size: int = 512,
-    chunk_overlap: int = 50
+    chunk_overlap: int = 50,
+    encoding_name: str = "cl100k_base",
+    max_workers: Optional[int] = None
 ) -> List[Dict]:
     """
     Process all supported files in a directory.
 
+    Files are processed in parallel across a pool of worker processes.
+
     Args:
         directory_path: Path to directory
         chunk_size: Maximum tokens per chunk
         chunk_overlap: Overlap tokens between chunks
+        encoding_name: Tokenizer encoding
+        max_workers: Number of worker processes (defaults to CPU count)
 
     Returns:
         List of all chunks from all files
     """
-    processor = DocumentProcessor(chunk_size, chunk_overlap)
     all_chunks = []
 
     directory = Path(directory_path)
@@ -257,14 +482,24 @@ def process_directory(
     if not directory.exists():
         raise FileNotFoundError(f"Directory not found: {directory_path}")
 
-    # Supported extensions
-    supported_extensions = {".pdf", ".md", ".markdown", ".txt"}
-
     # Find all supported files
-    for file_path in directory.rglob("*"):
-        if file_path.is_file() and file_path.suffix.lower() in supported_extensions:
+    files = [Path(file_path) for file_path in walk_supported_files(str(directory))]
+
+    if not files:
+        return all_chunks
+
+    with ProcessPoolExecutor(max_workers=max_workers or os.cpu_count()) as executor:
+        futures = {
+            executor.submit(
+                _process_one, str(file_path), chunk_size, chunk_overlap, encoding_name
+            ): file_path
+            for file_path in files
+        }
+
+        for future in as_completed(futures):
+            file_path = futures[future]
             try:
-                chunks = processor.process_file(str(file_path))
+                chunks = future.result()
                 all_chunks.extend(chunks)
                 print(f"Processed: {file_path.name} ({len(chunks)} chunks)")
             except Exception as e:
@@ -0,0 +1,143 @@
+"""
+Embedding Cache
+
+SQLite cache of chunk embeddings keyed by text hash and model.
+Lets re-indexing skip the embedding model for chunks it has seen before,
+which is most of them after a small edit.
+"""
+
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple
+
+import numpy as np
+
+
+class EmbeddingCache:
+    """
+    Stores embeddings as float16 blobs in a SQLite table.
+
+    Keys are sha256(text) digests; the model name is part of the primary
+    key so switching models never returns stale vectors. When the table
+    grows past max_entries the oldest rows are evicted, down to 90% of the
+    bound so the next eviction is some way off.
+    """
+
+    def __init__(
+        self,
+        path: str = "./data/emb_cache.sqlite",
+        max_entries: int = 1_000_000
+    ):
+        """
+        Initialize embedding cache.
+
+        Args:
+            path: SQLite database file
+            max_entries: Rows kept before the oldest are evicted
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+
+        # Embeddings are generated from worker threads, so share one
+        # connection behind a lock
+        self._lock = threading.Lock()
+        self.db = sqlite3.connect(str(self.path), check_same_thread=False)
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "key BLOB NOT NULL, "
+                "model TEXT NOT NULL, "
+                "embedding BLOB NOT NULL, "
+                "PRIMARY KEY (key, model))"
+            )
+
+        # Upper bound on the row count (replaced rows are counted twice),
+        # so the table is only counted exactly when it may be over the bound
+        self._count = self.db.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    @staticmethod
+    def key(text: str) -> bytes:
+        """
+        Build the cache key for a text.
+
+        Args:
+            text: Chunk text
+
+        Returns:
+            sha256 digest of the UTF-8 text
+        """
+        return hashlib.sha256(text.encode("utf-8")).digest()
+
+    def get_many(self, keys: List[bytes], model: str) -> Dict[bytes, np.ndarray]:
+        """
+        Look up embeddings for several keys.
+
+        Args:
+            keys: Keys from EmbeddingCache.key
+            model: Embedding model name
+
+        Returns:
+            Dictionary of float32 vectors for the keys that were found
+        """
+        found = {}
+        unique_keys = list(dict.fromkeys(keys))
+
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for start in range(0, len(unique_keys), 900):
+                batch = unique_keys[start:start + 900]
+                placeholders = ",".join("?" * len(batch))
+                rows = self.db.execute(
+                    f"SELECT key, embedding FROM embeddings "
+                    f"WHERE model = ? AND key IN ({placeholders})",
+                    [model, *batch]
+                ).fetchall()
+
+                for key, embedding in rows:
+                    found[key] = np.frombuffer(embedding, dtype=np.float16).astype(np.float32)
+
+        return found
+
+    def put_many(self, items: Iterable[Tuple[bytes, np.ndarray]], model: str) -> None:
+        """
+        Store embeddings, replacing existing entries.
+
+        Args:
+            items: (key, vector) pairs
+            model: Embedding model name
+        """
+        rows = [
+            (key, model, np.asarray(vector, dtype=np.float16).tobytes())
+            for key, vector in items
+        ]
+        if not rows:
+            return
+
+        with self._lock, self.db:
+            self.db.executemany(
+                "INSERT OR REPLACE INTO embeddings (key, model, embedding) "
+                "VALUES (?, ?, ?)",
+                rows
+            )
+
+            self._count += len(rows)
+            if self._count <= self.max_entries:
+                return
+
+            self._count = self.db.execute(
+                "SELECT COUNT(*) FROM embeddings"
+            ).fetchone()[0]
+            if self._count <= self.max_entries:
+                return
+
+            # Evict the oldest rows (lowest rowid) down to the low-water mark
+            excess = self._count - int(self.max_entries * 0.9)
+            self.db.execute(
+                "DELETE FROM embeddings WHERE rowid IN "
+                "(SELECT rowid FROM embeddings ORDER BY rowid LIMIT ?)",
+                (excess,)
+            )
+            self._count -= excess
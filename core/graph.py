@@ -5,14 +5,20 @@ Defines the agent graph for the RAG system.
 Nodes represent agents, edges represent message flow.
 """
 
+from functools import lru_cache
+
 from langgraph.graph import StateGraph, START, END
 from core.state import RAGState
 
 
+@lru_cache(maxsize=1)
 def create_rag_graph():
     """
     Creates and returns the LangGraph workflow for RAG.
 
+    The graph is built and compiled once per process; later calls
+    return the same compiled app.
+
     Graph Flow:
     1. START → retriever
     2. retriever → (conditional)
@@ -7,12 +7,33 @@ Handles incremental updates when documents are added/modified.
 
 import json
 import os
+import asyncio
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime
 
-from core.document_processor import DocumentProcessor, process_directory
-from core.vector_store import VectorStore
+try:
+    import orjson
+except ImportError:  # orjson is optional; falls back to stdlib json
+    orjson = None
+
+from core.chunk_cache import ChunkCache
+from core.document_processor import (
+    DocumentProcessor,
+    _process_one,
+    process_directory,
+    walk_supported_files
+)
+
+if TYPE_CHECKING:
+    # Imported for annotations only; chromadb and the embedding model load lazily
+    from core.vector_store import VectorStore
+
+
+# Number of chunks sent to ChromaDB per insert (override with N2A_CHROMA_BATCH)
+DEFAULT_CHROMA_BATCH = 128
 
 
 class KnowledgeBase:
@@ -28,9 +49,12 @@ class KnowledgeBase:
 
     def __init__(
         self,
-        vector_store: VectorStore,
+        vector_store: "VectorStore",
         document_processor: Optional[DocumentProcessor] = None,
-        index_file: str = "./data/index_metadata.json"
+        index_file: str = "./data/index_metadata.json",
+        batch_size: Optional[int] = None,
+        chunk_cache: Optional[ChunkCache] = None,
+        process_workers: Optional[int] = None
     ):
         """
         Initialize knowledge base manager.
@@ -39,10 +63,20 @@ class KnowledgeBase:
             vector_store: VectorStore instance
             document_processor: DocumentProcessor instance (creates default if None)
             index_file: Path to file tracking indexed documents
+            batch_size: Chunks per ChromaDB insert (defaults to N2A_CHROMA_BATCH or 128)
+            chunk_cache: ChunkCache instance (creates default if None)
+            process_workers: Processes parsing files during refresh
+                (defaults to CPU count, 1 processes inline; DocumentProcessor
+                subclasses always process inline)
         """
         self.vector_store = vector_store
         self.document_processor = document_processor or DocumentProcessor()
         self.index_file = Path(index_file)
+        self.batch_size = batch_size or int(
+            os.environ.get("N2A_CHROMA_BATCH", DEFAULT_CHROMA_BATCH)
+        )
+        self.chunk_cache = chunk_cache or ChunkCache()
+        self.process_workers = process_workers or os.cpu_count() or 1
 
         # Load or create index metadata
         self.index_metadata = self._load_index_metadata()
@@ -83,11 +117,7 @@ class KnowledgeBase:
         }
 
         # Find all supported files
-        supported_extensions = {".pdf", ".md", ".markdown", ".txt"}
-        all_files = [
-            f for f in docs_path.rglob("*")
-            if f.is_file() and f.suffix.lower() in supported_extensions
-        ]
+        all_files = [Path(f) for f in walk_supported_files(str(docs_path))]
 
         stats["total_files"] = len(all_files)
         print(f"Found {len(all_files)} document(s)\n")
@@ -95,18 +125,32 @@ class KnowledgeBase:
         # Track current files
         current_file_paths = {str(f.absolute()) for f in all_files}
 
+        # Indexed file records, looked up once for the whole refresh
+        files_map = self.index_metadata.setdefault("files", {})
+
         # Handle deleted files (files in index but not in directory)
         if incremental and not force:
-            deleted_files = self._handle_deleted_files(current_file_paths)
+            deleted_files = self._handle_deleted_files(current_file_paths, files_map)
             stats["deleted_files"] = len(deleted_files)
 
-        # Process each file
+        # Hash every file that may have changed in one parallel pass;
+        # change detection and chunking reuse these hashes
+        file_hashes = self._batch_hash_files([
+            f for f in all_files
+            if force or not incremental or not self._stat_unchanged(f, files_map)
+        ])
+
+        # Decide which files need processing
+        to_process = []
+        previous_hashes = {}  # file key -> hash it was indexed under
         for file_path in all_files:
             try:
-                should_process = self._should_process_file(
+                should_process, previous_hash = self._should_process_file(
                     file_path,
+                    files_map,
                     incremental=incremental,
-                    force=force
+                    force=force,
+                    file_hashes=file_hashes
                 )
 
                 if not should_process:
@@ -114,37 +158,106 @@ class KnowledgeBase:
                     stats["skipped_files"] += 1
                     continue
 
-                # Process the file
-                print(f"📄 Processing: {file_path.name}")
-                chunks = self.document_processor.process_file(str(file_path))
-
-                if not chunks:
-                    print(f"⚠️  No content extracted from: {file_path.name}")
-                    continue
-
-                # Get file hash from first chunk's metadata
-                file_hash = chunks[0]["metadata"]["file_hash"]
-
-                # Delete old version if exists
-                if incremental:
-                    self.vector_store.delete_by_hash(file_hash)
-
-                # Index new chunks
-                self.vector_store.add_documents(chunks)
-
-                # Update index metadata
-                self._update_index_metadata(file_path, file_hash, len(chunks))
-
-                stats["processed_files"] += 1
-                stats["total_chunks"] += len(chunks)
-
-                print(f"✅ Indexed: {file_path.name} ({len(chunks)} chunks)\n")
+                # Stat before reading, so a later edit shows up as a mismatch
+                to_process.append((file_path, file_path.stat()))
+                if previous_hash:
+                    previous_hashes[str(file_path.absolute())] = previous_hash
 
             except Exception as e:
                 error_msg = f"Error processing {file_path.name}: {str(e)}"
                 print(f"❌ {error_msg}\n")
                 stats["errors"].append(error_msg)
 
+        # One timestamp for every file indexed by this refresh
+        now_iso = datetime.now().isoformat()
+
+        # Chunks waiting to be inserted, and the files they belong to
+        pending_chunks = []
+        pending_files = []
+
+        # Embeds each batch while the previous one is still being inserted
+        pipeline = _InsertPipeline(self, stats, now_iso)
+
+        # Defer vector index maintenance until every file is inserted
+        with self.vector_store.bulk_mode(), pipeline:
+            # Files are parsed and chunked in worker processes; inserts stay here
+            for file_path, file_stat, chunks, error in self._process_files(
+                to_process,
+                use_cache=not force
+            ):
+                file_hash = None
+                num_chunks = 0
+                buffered = 0  # this file's chunks still waiting in the buffer
+                flushed = False  # some of this file's chunks already inserted
+
+                try:
+                    if error is not None:
+                        raise error
+
+                    # Move the file's chunks into the insert buffer
+                    print(f"📄 Processing: {file_path.name}")
+                    for chunk in chunks:
+                        if file_hash is None:
+                            # Get file hash from first chunk's metadata
+                            file_hash = chunk["metadata"]["file_hash"]
+
+                            # Delete old version only if the file was indexed
+                            # before and its content changed (or force re-indexing).
+                            # Rows are per file, so copies elsewhere are untouched
+                            file_key = str(file_path.absolute())
+                            previous_hash = previous_hashes.get(file_key)
+                            if previous_hash and (previous_hash != file_hash or force):
+                                self.vector_store.delete_by_file_paths([file_key])
+
+                        pending_chunks.append(chunk)
+                        buffered += 1
+                        num_chunks += 1
+
+                        if len(pending_chunks) >= self.batch_size:
+                            pipeline.flush(pending_chunks, pending_files)
+                            buffered = 0
+                            flushed = True
+                            if pipeline.has_failed(file_path):
+                                raise RuntimeError("batch insert failed")
+
+                    if flushed and pipeline.has_failed(file_path):
+                        raise RuntimeError("batch insert failed")
+
+                    if not num_chunks:
+                        print(f"⚠️  No content extracted from: {file_path.name}")
+                        continue
+
+                    # All chunks buffered; the file is recorded once they are inserted
+                    pending_files.append((file_path, file_hash, num_chunks, file_stat))
+
+                except Exception as e:
+                    # Drop this file's buffered chunks and anything already inserted
+                    if buffered:
+                        del pending_chunks[-buffered:]
+                    if flushed:
+                        # Let the batch in flight land before deleting its rows
+                        pipeline.wait()
+
+                        file_key = str(file_path.absolute())
+                        try:
+                            self.vector_store.delete_by_file_paths([file_key])
+                        except Exception as cleanup_error:
+                            print(f"⚠️  Could not remove partial chunks: {cleanup_error}")
+
+                        # Any earlier version is gone too; re-index next refresh
+                        files_map.pop(file_key, None)
+
+                    error_msg = f"Error processing {file_path.name}: {str(e)}"
+                    print(f"❌ {error_msg}\n")
+                    stats["errors"].append(error_msg)
+
+            # Insert whatever is left in the buffer
+            pipeline.flush(pending_chunks, pending_files)
+            pipeline.wait()
+
+        if stats["processed_files"]:
+            self.index_metadata["last_updated"] = now_iso
+
         # Save updated index metadata
         self._save_index_metadata()
 
@@ -209,64 +322,310 @@ class KnowledgeBase:
 
         return files
 
+    def _process_files(
+        self,
+        files: List[Tuple[Path, os.stat_result]],
+        use_cache: bool
+    ) -> Iterator[Tuple[Path, os.stat_result, Iterable[Dict], Optional[Exception]]]:
+        """
+        Produce each file's chunks, in input order.
+
+        Cache hits are served here; everything else is parsed and chunked
+        in a ProcessPoolExecutor, with at most two files per worker in
+        flight so finished results don't pile up in memory. With
+        process_workers <= 1, or a DocumentProcessor subclass (workers can
+        only rebuild the base class), files are streamed inline instead.
+
+        Args:
+            files: (file_path, stat) pairs to process
+            use_cache: If False, skip chunk cache lookups (the cache is still updated)
+
+        Yields:
+            (file_path, stat, chunks, error) tuples; chunks is None on error
+        """
+        # Workers rebuild a plain DocumentProcessor from its settings, which
+        # would silently drop a subclass's behaviour
+        inline = type(self.document_processor) is not DocumentProcessor
+        if self.process_workers <= 1 or inline:
+            for file_path, file_stat in files:
+                yield file_path, file_stat, self._iter_file_chunks(file_path, use_cache), None
+            return
+
+        processor = self.document_processor
+        window = deque()
+        remaining = iter(files)
+
+        with ProcessPoolExecutor(max_workers=self.process_workers) as executor:
+
+            def fill() -> None:
+                while len(window) < 2 * self.process_workers:
+                    item = next(remaining, None)
+                    if item is None:
+                        return
+
+                    file_path, file_stat = item
+                    try:
+                        job = self._get_cached_chunks(file_path) if use_cache else None
+                        if job is None:
+                            # Hand the worker the hash computed up front
+                            job = executor.submit(
+                                _process_one,
+                                str(file_path),
+                                processor.chunk_size,
+                                processor.chunk_overlap,
+                                processor.encoding.name,
+                                processor._hash_cache.get(str(file_path))
+                            )
+                    except Exception as e:
+                        job = e
+
+                    window.append((file_path, file_stat, job))
+
+            fill()
+            while window:
+                file_path, file_stat, job = window.popleft()
+
+                # Keep workers busy while this file is being inserted
+                fill()
+
+                if isinstance(job, Exception):
+                    yield file_path, file_stat, None, job
+                elif isinstance(job, list):
+                    yield file_path, file_stat, job, None
+                else:
+                    try:
+                        chunks = job.result()
+                    except Exception as e:
+                        yield file_path, file_stat, None, e
+                        continue
+
+                    self._put_cached_chunks(chunks)
+                    yield file_path, file_stat, chunks, None
+
+    def _iter_file_chunks(self, file_path: Path, use_cache: bool) -> Iterator[Dict]:
+        """
+        Yield a file's chunks, served from the chunk cache when possible.
+
+        Freshly processed chunks are written back to the cache.
+
+        Args:
+            file_path: Path to file
+            use_cache: If False, always re-process (the cache is still updated)
+
+        Yields:
+            Chunk dictionaries with text and metadata
+        """
+        cached = self._get_cached_chunks(file_path) if use_cache else None
+        if cached is not None:
+            yield from cached
+            return
+
+        chunks = []
+        for chunk in self.document_processor.iter_chunks(str(file_path)):
+            if self.chunk_cache.enabled:
+                chunks.append(chunk)
+            yield chunk
+
+        self._put_cached_chunks(chunks)
+
+    def _get_cached_chunks(self, file_path: Path) -> Optional[List[Dict]]:
+        """
+        Load a file's chunks from the chunk cache.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            List of chunks, or None if the cache is disabled or misses
+        """
+        if not self.chunk_cache.enabled:
+            return None
+
+        file_hash = self.document_processor._compute_file_hash(file_path)
+        cached = self.chunk_cache.get(file_hash, self._chunk_cache_config())
+        if cached is None:
+            return None
+
+        print(f"♻️  Loaded from chunk cache: {file_path.name}")
+
+        # The same content may live under a different name now
+        timestamp = datetime.now().isoformat()
+        for chunk in cached:
+            chunk["metadata"]["source"] = file_path.name
+            chunk["metadata"]["file_path"] = str(file_path.absolute())
+            chunk["metadata"]["timestamp"] = timestamp
+
+        return cached
+
+    def _put_cached_chunks(self, chunks: List[Dict]) -> None:
+        """
+        Store a file's freshly processed chunks in the chunk cache.
+
+        Args:
+            chunks: The file's chunks (may be empty)
+        """
+        if not chunks or not self.chunk_cache.enabled:
+            return
+
+        file_hash = chunks[0]["metadata"]["file_hash"]
+        self.chunk_cache.put(file_hash, self._chunk_cache_config(), chunks)
+
+    def _chunk_cache_config(self) -> str:
+        """
+        Identify the chunking settings for chunk cache keys.
+
+        Subclasses may chunk differently, so their class name is part of
+        the key; the base class keeps the plain settings string.
+
+        Returns:
+            Settings string, e.g. "512-50-cl100k_base"
+        """
+        processor = self.document_processor
+        config = f"{processor.chunk_size}-{processor.chunk_overlap}-{processor.encoding.name}"
+        if type(processor) is not DocumentProcessor:
+            config = f"{type(processor).__name__}-{config}"
+
+        return config
+
     def _should_process_file(
         self,
         file_path: Path,
+        files_map: Dict[str, Dict],
         incremental: bool,
-        force: bool
-    ) -> bool:
+        force: bool,
+        file_hashes: Optional[Dict[Path, str]] = None
+    ) -> Tuple[bool, Optional[str]]:
         """
         Determine if a file should be processed.
 
         Args:
             file_path: Path to file
+            files_map: Indexed file records (index_metadata["files"])
             incremental: Incremental mode flag
             force: Force re-index flag
+            file_hashes: Hashes already computed by _batch_hash_files
 
         Returns:
-            True if file should be processed
+            Tuple of (should_process, previous_hash); previous_hash is the
+            hash the file was last indexed under, or None for a new file
         """
-        if force:
-            return True
+        file_key = str(file_path.absolute())
+        indexed = files_map.get(file_key)
+        previous_hash = indexed.get("hash") if indexed else None
 
-        if not incremental:
-            return True
+        if force or not incremental:
+            return True, previous_hash
 
         # Check if file is in index
-        file_key = str(file_path.absolute())
-        if file_key not in self.index_metadata.get("files", {}):
-            return True  # New file
+        if indexed is None:
+            return True, None  # New file
+
+        # Unchanged mtime and size: skip without reading the file
+        stat = file_path.stat()
+        if (
+            stat.st_mtime_ns == indexed.get("mtime_ns")
+            and stat.st_size == indexed.get("size")
+        ):
+            return False, previous_hash
 
         # Check if file hash changed
-        current_hash = self.document_processor._compute_file_hash(file_path)
-        indexed_hash = self.index_metadata["files"][file_key].get("hash")
+        current_hash = (file_hashes or {}).get(file_path)
+        if current_hash is None:
+            current_hash = self.document_processor._compute_file_hash(file_path)
+        if current_hash != previous_hash:
+            return True, previous_hash
+
+        # Same content (e.g. touched or copied); remember the new stat
+        indexed["mtime_ns"] = stat.st_mtime_ns
+        indexed["size"] = stat.st_size
+
+        return False, previous_hash
+
+    def _stat_unchanged(self, file_path: Path, files_map: Dict[str, Dict]) -> bool:
+        """
+        Check whether a file's mtime and size match its index record.
+
+        Args:
+            file_path: Path to file
+            files_map: Indexed file records (index_metadata["files"])
 
-        return current_hash != indexed_hash
+        Returns:
+            True if the file is indexed and its stat is unchanged
+        """
+        indexed = files_map.get(str(file_path.absolute()))
+        if indexed is None:
+            return False
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+
+        return (
+            stat.st_mtime_ns == indexed.get("mtime_ns")
+            and stat.st_size == indexed.get("size")
+        )
+
+    def _batch_hash_files(self, paths: List[Path]) -> Dict[Path, str]:
+        """
+        Hash several files concurrently on a thread pool.
+
+        Hashing releases the GIL while reading, so threads keep several
+        reads in flight. Results also land in the document processor's
+        hash cache, where the chunker picks them up.
+
+        Args:
+            paths: Files to hash
 
-    def _handle_deleted_files(self, current_file_paths: set) -> List[str]:
+        Returns:
+            Dictionary mapping each path to its hash; files that could not
+            be read are left out and fail later with a per-file error
+        """
+        if not paths:
+            return {}
+
+        def _hash(file_path: Path) -> Optional[str]:
+            try:
+                return self.document_processor._compute_file_hash(file_path)
+            except OSError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(32, len(paths))) as executor:
+            hashes = executor.map(_hash, paths)
+
+            return {
+                file_path: file_hash
+                for file_path, file_hash in zip(paths, hashes)
+                if file_hash is not None
+            }
+
+    def _handle_deleted_files(
+        self,
+        current_file_paths: set,
+        files_map: Dict[str, Dict]
+    ) -> List[str]:
         """
         Remove deleted files from vector store and index.
 
         Args:
             current_file_paths: Set of current file paths
+            files_map: Indexed file records (index_metadata["files"])
 
         Returns:
             List of deleted file paths
         """
-        deleted_files = []
-
-        indexed_files = list(self.index_metadata.get("files", {}).keys())
+        deleted_files = [
+            file_path for file_path in files_map
+            if file_path not in current_file_paths
+        ]
 
-        for file_path in indexed_files:
-            if file_path not in current_file_paths:
-                # File was deleted
-                file_hash = self.index_metadata["files"][file_path].get("hash")
-                if file_hash:
-                    self.vector_store.delete_by_hash(file_hash)
+        for file_path in deleted_files:
+            del files_map[file_path]
+            print(f"🗑️  Removed deleted file: {Path(file_path).name}")
 
-                del self.index_metadata["files"][file_path]
-                deleted_files.append(file_path)
-                print(f"🗑️  Removed deleted file: {Path(file_path).name}")
+        # One round trip for all deleted files
+        if deleted_files:
+            self.vector_store.delete_by_file_paths(deleted_files)
 
         return deleted_files
 
@@ -274,26 +633,32 @@ class KnowledgeBase:
         self,
         file_path: Path,
         file_hash: str,
-        num_chunks: int
+        num_chunks: int,
+        stat: os.stat_result,
+        timestamp: str
     ) -> None:
         """
         Update index metadata for a file.
 
+        The refresh sets last_updated once, after all files are recorded.
+
         Args:
             file_path: Path to file
             file_hash: File hash
             num_chunks: Number of chunks indexed
+            stat: File stat taken before the file was processed
+            timestamp: ISO timestamp of the refresh
         """
         file_key = str(file_path.absolute())
 
         self.index_metadata["files"][file_key] = {
             "hash": file_hash,
             "chunks": num_chunks,
-            "indexed_at": datetime.now().isoformat()
+            "indexed_at": timestamp,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size
         }
 
-        self.index_metadata["last_updated"] = datetime.now().isoformat()
-
     def _load_index_metadata(self) -> Dict:
         """
         Load index metadata from file.
@@ -303,8 +668,8 @@ class KnowledgeBase:
         """
         if self.index_file.exists():
             try:
-                with open(self.index_file, 'r') as f:
-                    return json.load(f)
+                data = self.index_file.read_bytes()
+                return orjson.loads(data) if orjson else json.loads(data)
             except Exception as e:
                 print(f"Warning: Could not load index metadata: {e}")
 
@@ -313,18 +678,188 @@ class KnowledgeBase:
     def _save_index_metadata(self) -> None:
         """
         Save index metadata to file.
+
+        Writes to a temp file and renames it over the index, so a crash
+        mid-write never leaves a truncated index behind.
         """
         # Ensure directory exists
         self.index_file.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(self.index_file, 'w') as f:
-            json.dump(self.index_metadata, f, indent=2)
+        if orjson:
+            data = orjson.dumps(self.index_metadata, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(self.index_metadata, indent=2).encode("utf-8")
+
+        tmp = self.index_file.with_suffix(self.index_file.suffix + ".tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, self.index_file)
+
+
+class _InsertPipeline:
+    """
+    Embeds and inserts refresh batches on one event loop.
+
+    Each flush embeds its batch while the previous batch's insert is
+    still in flight, so insert latency hides behind embedding across the
+    whole refresh. A file is recorded as indexed once the insert holding
+    its last chunk lands; a file with chunks in a failed batch is
+    reported, its rows are removed and it is retried next refresh.
+    """
+
+    def __init__(self, kb: KnowledgeBase, stats: Dict, timestamp: str):
+        """
+        Initialize the pipeline.
+
+        Args:
+            kb: KnowledgeBase being refreshed
+            stats: Refresh statistics to update
+            timestamp: ISO timestamp recorded as the files' indexed_at
+        """
+        self.kb = kb
+        self.stats = stats
+        self.timestamp = timestamp
+        self.loop = asyncio.new_event_loop()
+
+        # File keys with chunks in a failed batch, and the error message
+        self.failed: Dict[str, str] = {}
+
+        # (task, files, file keys) of the batch being inserted
+        self._in_flight = None
+
+    def __enter__(self) -> "_InsertPipeline":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        try:
+            self.wait()
+            self.loop.run_until_complete(self.loop.shutdown_default_executor())
+        finally:
+            self.loop.close()
+
+    def has_failed(self, file_path: Path) -> bool:
+        """
+        Check whether any of a file's chunks were in a failed batch.
+
+        Args:
+            file_path: Path to file
+
+        Returns:
+            True if the file can no longer be fully indexed this refresh
+        """
+        return str(file_path.absolute()) in self.failed
+
+    def flush(self, pending_chunks: List[Dict], pending_files: List[tuple]) -> None:
+        """
+        Embed buffered chunks and start inserting them.
+
+        Both buffers are emptied in place. pending_files holds
+        (file_path, file_hash, num_chunks, stat) for files whose last
+        chunk is in this batch.
+
+        Args:
+            pending_chunks: Chunks waiting to be inserted
+            pending_files: Files completed by this batch
+        """
+        if not pending_chunks:
+            return
+
+        texts = [chunk["text"] for chunk in pending_chunks]
+        metadatas = [chunk["metadata"] for chunk in pending_chunks]
+        files = list(pending_files)
+        keys = {metadata["file_path"] for metadata in metadatas}
+        pending_chunks.clear()
+        pending_files.clear()
+
+        vector_store = self.kb.vector_store
+        print(f"Embedding and adding {len(texts)} chunks...")
+
+        try:
+            # The previous insert keeps running while this batch embeds
+            embeddings = self.loop.run_until_complete(
+                vector_store.aembed_documents(texts, batch_size=self.kb.batch_size)
+            )
+            ids = vector_store._chunk_ids(metadatas)
+        except Exception as e:
+            self.wait()
+            self._fail(files, keys, e)
+            return
+
+        # One insert in flight: wait for the previous before queueing the next
+        self.wait()
+        task = self.loop.create_task(
+            vector_store.aadd_batch(ids, texts, metadatas, embeddings)
+        )
+        self._in_flight = (task, files, keys)
+
+    def wait(self) -> None:
+        """
+        Wait for the insert in flight and record the files it completed.
+        """
+        if self._in_flight is None:
+            return
+
+        task, files, keys = self._in_flight
+        self._in_flight = None
+
+        try:
+            self.loop.run_until_complete(task)
+        except Exception as e:
+            self._fail(files, keys, e)
+            return
+
+        # Files whose earlier batch failed are not recorded
+        tainted = [entry for entry in files if self.has_failed(entry[0])]
+        if tainted:
+            self._fail(tainted, set(), None)
+
+        for file_path, file_hash, num_chunks, file_stat in files:
+            if self.has_failed(file_path):
+                continue
+
+            self.kb._update_index_metadata(
+                file_path, file_hash, num_chunks, file_stat, self.timestamp
+            )
+
+            self.stats["processed_files"] += 1
+            self.stats["total_chunks"] += num_chunks
+
+            print(f"✅ Indexed: {file_path.name} ({num_chunks} chunks)\n")
+
+    def _fail(self, files: List[tuple], keys: set, error: Optional[Exception]) -> None:
+        """
+        Mark a failed batch's files and remove what they already inserted.
+
+        Args:
+            files: Files completed by the batch, reported as errors
+            keys: File keys with chunks in the batch
+            error: Insert or embedding error (None for files of an earlier batch)
+        """
+        for key in keys:
+            self.failed.setdefault(key, str(error))
+
+        file_keys = [str(file_path.absolute()) for file_path, *_ in files]
+        for file_path, *_ in files:
+            message = self.failed.setdefault(str(file_path.absolute()), str(error))
+            error_msg = f"Error indexing {file_path.name}: {message}"
+            print(f"❌ {error_msg}\n")
+            self.stats["errors"].append(error_msg)
+
+        if not file_keys:
+            return
+
+        # Earlier batches may have landed; drop them and re-index next refresh
+        try:
+            self.kb.vector_store.delete_by_file_paths(file_keys)
+        except Exception as cleanup_error:
+            print(f"⚠️  Could not remove partial chunks: {cleanup_error}")
+        for key in file_keys:
+            self.kb.index_metadata["files"].pop(key, None)
 
 
 # Utility function
 
 def create_knowledge_base(
-    vector_store: VectorStore,
+    vector_store: "VectorStore",
     chunk_size: int = 512,
     chunk_overlap: int = 50
 ) -> KnowledgeBase:
@@ -0,0 +1,613 @@
+"""
+USearch Vector Store
+
+On-disk HNSW index (usearch) over int8-quantized (or binary) vectors.
+Chunk text, metadata and float16 embeddings live in a SQLite side table
+and are used to re-rank the approximate HNSW candidates.
+"""
+
+import json
+import sqlite3
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, List, Dict, Optional
+
+import numpy as np
+from usearch.index import Index
+
+from core.distance import cosine_topk
+from core.embedding_cache import EmbeddingCache
+from core.vector_store import VectorStore
+
+
+# quantization option -> (usearch dtype, metric)
+QUANTIZATION_MODES = {
+    "none": ("f32", "cos"),
+    "int8": ("i8", "cos"),
+    "binary": ("b1", "hamming"),
+}
+
+
+class USearchStore(VectorStore):
+    """
+    Vector store using a usearch HNSW index instead of ChromaDB.
+
+    Features:
+    - HNSW search over int8-quantized vectors (4x smaller than float32),
+      or sign bits (32x smaller) with quantization="binary"
+    - Exact re-rank of the top candidates against float16 copies
+    - SQLite side table for chunk text and metadata
+    - Same interface as VectorStore, so the CLI and KnowledgeBase work unchanged
+    """
+
+    def __init__(
+        self,
+        collection_name: str = "note2agent_docs",
+        persist_directory: str = "./data/usearch",
+        embedding_model: str = "BAAI/bge-small-en-v1.5",
+        embedding_batch_size: int = 128,
+        embedding_workers: int = 1,
+        connectivity: int = 16,
+        expansion_add: int = 64,
+        expansion_search: int = 100,
+        refine_k: int = 100,
+        quantization: str = "int8",
+        device: Optional[str] = None,
+        precision: str = "float16",
+        embedding_cache: Optional[EmbeddingCache] = None
+    ):
+        """
+        Initialize the usearch index and its metadata table.
+
+        Storage is entirely different from the ChromaDB base class, so the
+        base initializer is not called.
+
+        Args:
+            collection_name: Name used for the index and database files
+            persist_directory: Directory holding the index and database
+            embedding_model: Sentence Transformers model name
+            embedding_batch_size: Texts per embedding batch
+            embedding_workers: Processes encoding batches in parallel (1 disables)
+            connectivity: HNSW graph degree (M)
+            expansion_add: HNSW ef during construction
+            expansion_search: HNSW ef during search
+            refine_k: Candidates fetched from the index for re-ranking
+            quantization: Index vector format: "none", "int8" or "binary".
+                Binary keeps one sign bit per dimension; raise refine_k with it.
+            device: Torch device for the embedding model (defaults to cuda if available)
+            precision: "float16" to run the model in half precision on cuda, or "float32"
+            embedding_cache: EmbeddingCache instance (creates default if None)
+        """
+        if quantization not in QUANTIZATION_MODES:
+            raise ValueError(f"Unsupported quantization: {quantization}")
+
+        self.collection_name = collection_name
+        self.quantization = quantization
+
+        # The SQLite connection belongs to this thread, so inserts run inline
+        self.insert_batch_size = 500
+        self.insert_max_workers = 1
+
+        self.connectivity = connectivity
+        self.expansion_add = expansion_add
+        self.expansion_search = expansion_search
+        self.refine_k = refine_k
+        self._bulk = False
+
+        self._init_embeddings(
+            embedding_model,
+            embedding_batch_size,
+            embedding_workers,
+            device=device,
+            precision=precision,
+            embedding_cache=embedding_cache
+        )
+        self.dimensions = self.embedding_model.get_sentence_embedding_dimension()
+
+        self.persist_directory = Path(persist_directory)
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self._index_path(quantization)
+
+        # Metadata side table
+        self.db = sqlite3.connect(
+            str(self.persist_directory / f"{collection_name}.sqlite")
+        )
+        self._create_tables()
+
+        # Load the HNSW index if it matches the table, otherwise rebuild it
+        self.index = self._new_index()
+        if self._index_is_current():
+            self.index.load(str(self.index_path))
+        if len(self.index) != self._row_count():
+            self.index = self._new_index()
+            self._rebuild_index()
+
+    def add_batch(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict],
+        embeddings: np.ndarray
+    ) -> None:
+        """
+        Add a pre-embedded batch to the index and metadata table.
+
+        Chunks whose ID already exists are replaced.
+
+        Args:
+            ids: Unique chunk IDs
+            texts: Chunk texts
+            metadatas: Chunk metadata dictionaries
+            embeddings: Embedding vectors, one per chunk
+        """
+        if not ids:
+            return
+
+        vectors = np.asarray(embeddings, dtype=np.float32)
+
+        # Replace existing chunks with the same IDs
+        self._delete_where("chunk_id", ids)
+
+        # Index update happens inside the transaction so a failure rolls back
+        with self.db:
+            self._bump_generation()
+            row_ids = []
+            for chunk_id, text, metadata, vector in zip(ids, texts, metadatas, vectors):
+                cursor = self.db.execute(
+                    "INSERT INTO chunks "
+                    "(chunk_id, source, file_path, file_hash, text, metadata, embedding) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        chunk_id,
+                        metadata.get("source"),
+                        metadata.get("file_path"),
+                        metadata.get("file_hash"),
+                        text,
+                        json.dumps(metadata),
+                        vector.astype(np.float16).tobytes()
+                    )
+                )
+                row_ids.append(cursor.lastrowid)
+
+            self.index.add(np.asarray(row_ids, dtype=np.uint64), self._index_vectors(vectors))
+
+        self._save_index()
+
+    @contextmanager
+    def bulk_mode(self, **_: int) -> Iterator[None]:
+        """
+        Save the index once at the end instead of after every mutation.
+
+        The SQLite table stays transactional per batch; only the index file
+        lags until the block exits.
+        """
+        self._bulk = True
+        try:
+            yield
+        finally:
+            self._bulk = False
+            self._save_index()
+
+    async def aadd_batch(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict],
+        embeddings: np.ndarray
+    ) -> None:
+        """
+        Add a pre-embedded batch from async code.
+
+        Runs inline because the SQLite connection belongs to the thread
+        that opened it.
+
+        Args:
+            ids: Unique chunk IDs
+            texts: Chunk texts
+            metadatas: Chunk metadata dictionaries
+            embeddings: Embedding vectors, one per chunk
+        """
+        self.add_batch(ids, texts, metadatas, embeddings)
+
+    async def _aget_collection(self):
+        """
+        No remote collection; aadd_documents inserts through aadd_batch.
+
+        Returns:
+            None
+        """
+        return None
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 20,
+        filters: Optional[Dict] = None
+    ) -> List[Dict]:
+        """
+        Search for similar documents.
+
+        HNSW returns refine_k approximate candidates (or top_k, if larger),
+        which are re-ranked by cosine similarity against float16 copies.
+
+        Args:
+            query: Search query
+            top_k: Number of results to return
+            filters: Flat metadata equality filters, e.g. {"source": "a.pdf"}.
+                Applied to the candidates, so fewer than top_k may be returned.
+
+        Returns:
+            List of results with text, metadata, and cosine distance
+        """
+        if len(self.index) == 0:
+            return []
+
+        # Embed the query directly; queries are not worth a cache entry
+        query_vector = self._encode([query])[0]
+
+        # Approximate candidates from the quantized index
+        matches = self.index.search(
+            self._index_vectors(query_vector), max(self.refine_k, top_k)
+        )
+        row_ids = [int(key) for key in matches.keys]
+        if not row_ids:
+            return []
+
+        placeholders = ",".join("?" * len(row_ids))
+        rows = self.db.execute(
+            f"SELECT chunk_id, text, metadata, embedding FROM chunks "
+            f"WHERE row_id IN ({placeholders})",
+            row_ids
+        ).fetchall()
+
+        candidates = []
+        for chunk_id, text, metadata_json, embedding in rows:
+            metadata = json.loads(metadata_json)
+            if filters and any(metadata.get(k) != v for k, v in filters.items()):
+                continue
+            candidates.append((chunk_id, text, metadata, embedding))
+
+        if not candidates:
+            return []
+
+        # Re-rank against the float16 sidecar
+        db_vectors = np.frombuffer(
+            b"".join(candidate[3] for candidate in candidates), dtype=np.float16
+        ).reshape(len(candidates), self.dimensions)
+        top_idx, top_scores = cosine_topk(query_vector, db_vectors, top_k)
+
+        # Format results
+        formatted_results = []
+        for i, score in zip(top_idx, top_scores):
+            chunk_id, text, metadata, _ = candidates[i]
+            formatted_results.append({
+                "text": text,
+                "metadata": metadata,
+                "distance": float(1.0 - score),
+                "id": chunk_id
+            })
+
+        return formatted_results
+
+    def delete_by_source(self, source: str) -> None:
+        """
+        Delete all chunks from a specific source file.
+
+        Args:
+            source: Source filename to delete
+        """
+        self._delete_where("source", [source])
+        self._save_index()
+        print(f"Deleted all chunks from: {source}")
+
+    def delete_by_hash(self, file_hash: str) -> None:
+        """
+        Delete all chunks with a specific file hash.
+
+        Args:
+            file_hash: File hash to delete
+        """
+        self._delete_where("file_hash", [file_hash])
+        self._save_index()
+        print(f"Deleted all chunks with hash: {file_hash}")
+
+    def delete_by_hashes(self, file_hashes: List[str]) -> None:
+        """
+        Delete all chunks matching any of several file hashes.
+
+        Args:
+            file_hashes: File hashes to delete
+        """
+        if not file_hashes:
+            return
+
+        self._delete_where("file_hash", list(file_hashes))
+        self._save_index()
+        print(f"Deleted all chunks for {len(file_hashes)} file hash(es)")
+
+    def delete_by_file_paths(self, file_paths: List[str]) -> None:
+        """
+        Delete all chunks of several files.
+
+        Args:
+            file_paths: Absolute file paths, as stored in chunk metadata
+        """
+        if not file_paths:
+            return
+
+        self._delete_where("file_path", list(file_paths))
+        self._save_index()
+        print(f"Deleted all chunks for {len(file_paths)} file(s)")
+
+    def get_collection_stats(self) -> Dict:
+        """
+        Get statistics about the collection.
+
+        Returns:
+            Dictionary with collection statistics
+        """
+        count = self.db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+        return {
+            "collection_name": self.collection_name,
+            "total_chunks": count,
+            "model": self.embedding_model_name
+        }
+
+    def clear_collection(self) -> None:
+        """
+        Delete all documents from the index and metadata table.
+        """
+        with self.db:
+            self.db.execute("DELETE FROM chunks")
+            self._bump_generation()
+
+        self.index = self._new_index()
+        for quantization in QUANTIZATION_MODES:
+            path = self._index_path(quantization)
+            path.unlink(missing_ok=True)
+            self._generation_path(path).unlink(missing_ok=True)
+
+        print(f"Cleared collection: {self.collection_name}")
+
+    def health_check(self) -> bool:
+        """
+        Check if the metadata database is accessible.
+
+        Returns:
+            True if healthy, False otherwise
+        """
+        try:
+            self.db.execute("SELECT 1")
+            return True
+        except Exception as e:
+            print(f"USearch store health check failed: {str(e)}")
+            return False
+
+    def _delete_where(self, column: str, values: List[str]) -> None:
+        """
+        Delete chunks whose column matches any of the values.
+
+        Args:
+            column: One of chunk_id, source, file_path, file_hash
+            values: Values to match
+        """
+        if not values:
+            return
+
+        placeholders = ",".join("?" * len(values))
+        row_ids = [
+            row[0] for row in self.db.execute(
+                f"SELECT row_id FROM chunks WHERE {column} IN ({placeholders})",
+                values
+            )
+        ]
+        if not row_ids:
+            return
+
+        with self.db:
+            self._bump_generation()
+            self.db.execute(
+                f"DELETE FROM chunks WHERE row_id IN ({','.join('?' * len(row_ids))})",
+                row_ids
+            )
+            self.index.remove(np.asarray(row_ids, dtype=np.uint64))
+
+    def _save_index(self) -> None:
+        """
+        Write the index file, unless a bulk ingest is in progress.
+        """
+        if not self._bulk:
+            self._write_index()
+
+    def _write_index(self) -> None:
+        """
+        Write the index file and the table generation it reflects.
+        """
+        self.index.save(str(self.index_path))
+        self._generation_path(self.index_path).write_text(str(self._generation()))
+
+    def _index_path(self, quantization: str) -> Path:
+        """
+        Build the index file path for a quantization format.
+
+        Args:
+            quantization: One of QUANTIZATION_MODES
+
+        Returns:
+            Path to the index file; int8 keeps the original name
+        """
+        suffix = "" if quantization == "int8" else f".{quantization}"
+        return self.persist_directory / f"{self.collection_name}{suffix}.usearch"
+
+    def _generation_path(self, index_path: Path) -> Path:
+        """
+        Build the path of the file recording an index's table generation.
+
+        Args:
+            index_path: Index file path
+
+        Returns:
+            Path to the generation file
+        """
+        return index_path.with_name(index_path.name + ".gen")
+
+    def _generation(self) -> int:
+        """
+        Read the table generation, bumped by every change to the chunks.
+
+        Returns:
+            Current generation (0 for tables that predate it)
+        """
+        row = self.db.execute(
+            "SELECT value FROM state WHERE key = 'generation'"
+        ).fetchone()
+        return row[0] if row else 0
+
+    def _bump_generation(self) -> None:
+        """
+        Advance the table generation; call inside the changing transaction.
+
+        Index files of the other formats no longer match, so they are removed.
+        """
+        self.db.execute(
+            "INSERT INTO state (key, value) VALUES ('generation', 1) "
+            "ON CONFLICT(key) DO UPDATE SET value = value + 1"
+        )
+        for quantization in QUANTIZATION_MODES:
+            if quantization != self.quantization:
+                path = self._index_path(quantization)
+                path.unlink(missing_ok=True)
+                self._generation_path(path).unlink(missing_ok=True)
+
+    def _index_is_current(self) -> bool:
+        """
+        Check whether the index file was saved at the table's generation.
+
+        Returns:
+            True if the index file exists and matches the table
+        """
+        if not self.index_path.exists():
+            return False
+
+        generation_path = self._generation_path(self.index_path)
+        try:
+            saved = int(generation_path.read_text()) if generation_path.exists() else 0
+        except ValueError:
+            return False
+
+        return saved == self._generation()
+
+    def _row_count(self) -> int:
+        """
+        Count chunks in the side table.
+
+        Returns:
+            Number of rows
+        """
+        return self.db.execute("SELECT COUNT(*) FROM chunks").fetchone()[0]
+
+    def _index_vectors(self, vectors: np.ndarray) -> np.ndarray:
+        """
+        Convert float vectors to the form the index stores.
+
+        Args:
+            vectors: Float vectors, shape (n, d) or (d,)
+
+        Returns:
+            Vectors for the index; sign bits packed into bytes when binary
+        """
+        if self.quantization == "binary":
+            return np.packbits(vectors > 0, axis=-1)
+
+        return vectors
+
+    def _rebuild_index(self) -> None:
+        """
+        Rebuild the HNSW index from the float16 embeddings in the side table.
+
+        Used when the index file is missing or out of date, e.g. after
+        switching quantization or an interrupted bulk ingest.
+        """
+        count = self._row_count()
+        if not count:
+            self._write_index()
+            return
+
+        print(f"Rebuilding {self.quantization} index from {count} stored embeddings...")
+        cursor = self.db.execute("SELECT row_id, embedding FROM chunks")
+        while True:
+            rows = cursor.fetchmany(10000)
+            if not rows:
+                break
+
+            vectors = np.frombuffer(
+                b"".join(row[1] for row in rows), dtype=np.float16
+            ).reshape(len(rows), self.dimensions).astype(np.float32)
+            self.index.add(
+                np.asarray([row[0] for row in rows], dtype=np.uint64),
+                self._index_vectors(vectors)
+            )
+
+        self._write_index()
+
+    def _new_index(self) -> Index:
+        """
+        Create an empty HNSW index in the configured quantization.
+
+        Returns:
+            usearch Index
+        """
+        dtype, metric = QUANTIZATION_MODES[self.quantization]
+
+        return Index(
+            ndim=self.dimensions,
+            metric=metric,
+            dtype=dtype,
+            connectivity=self.connectivity,
+            expansion_add=self.expansion_add,
+            expansion_search=self.expansion_search
+        )
+
+    def _create_tables(self) -> None:
+        """
+        Create the chunk metadata table if it does not exist.
+        """
+        with self.db:
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS chunks ("
+                "row_id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                "chunk_id TEXT UNIQUE NOT NULL, "
+                "source TEXT, "
+                "file_path TEXT, "
+                "file_hash TEXT, "
+                "text TEXT NOT NULL, "
+                "metadata TEXT NOT NULL, "
+                "embedding BLOB NOT NULL)"
+            )
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chunks_file_hash ON chunks(file_hash)"
+            )
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chunks_source ON chunks(source)"
+            )
+
+            # Tables created before file_path had its own column
+            columns = {row[1] for row in self.db.execute("PRAGMA table_info(chunks)")}
+            if "file_path" not in columns:
+                self.db.execute("ALTER TABLE chunks ADD COLUMN file_path TEXT")
+                self.db.execute(
+                    "UPDATE chunks SET file_path = json_extract(metadata, '$.file_path')"
+                )
+
+            self.db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chunks_file_path ON chunks(file_path)"
+            )
+
+            # Generation counter matched against saved index files
+            self.db.execute(
+                "CREATE TABLE IF NOT EXISTS state (key TEXT PRIMARY KEY, value INTEGER)"
+            )
+
+
+# TODO: Support ChromaDB-style operator filters ($in, $and, ...)
@@ -6,11 +6,53 @@ Handles document indexing, retrieval, and metadata filtering.
 """
 
 import os
-from typing import List, Dict, Optional
+import atexit
+import asyncio
+import hashlib
+import queue
+import threading
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Iterator, List, Dict, Optional
+import numpy as np
 import chromadb
 from chromadb.config import Settings
 from sentence_transformers import SentenceTransformer
 
+from core.embedding_cache import EmbeddingCache
+
+
+# Padded tokens per encode call when packing batches by length
+DEFAULT_EMBED_TOKEN_BUDGET = 16384
+
+# ChromaDB's HNSW defaults, restored after bulk_mode if none are reported
+HNSW_DEFAULTS = {"batch_size": 100, "sync_threshold": 1000}
+
+
+@lru_cache(maxsize=4)
+def _load_st_model(name: str, device: str, half: bool) -> SentenceTransformer:
+    """
+    Load a Sentence Transformers model once per process.
+
+    Every VectorStore using the same model, device and precision shares
+    one instance instead of reloading the weights.
+
+    Args:
+        name: Sentence Transformers model name
+        device: Torch device
+        half: Convert the model to float16
+
+    Returns:
+        Loaded model
+    """
+    print(f"Loading embedding model: {name} ({device})")
+    model = SentenceTransformer(name, device=device)
+    if half:
+        model.half()
+    print("✓ Embedding model loaded")
+
+    return model
+
 
 class VectorStore:
     """
@@ -28,7 +70,14 @@ class VectorStore:
         collection_name: str = "note2agent_docs",
         chromadb_host: str = "localhost",
         chromadb_port: int = 8000,
-        embedding_model: str = "BAAI/bge-small-en-v1.5"
+        embedding_model: str = "BAAI/bge-small-en-v1.5",
+        embedding_batch_size: int = 128,
+        embedding_workers: int = 1,
+        insert_batch_size: int = 500,
+        insert_max_workers: int = 8,
+        device: Optional[str] = None,
+        precision: str = "float16",
+        embedding_cache: Optional[EmbeddingCache] = None
     ):
         """
         Initialize vector store with local embeddings.
@@ -38,14 +87,27 @@ class VectorStore:
             chromadb_host: ChromaDB server host
             chromadb_port: ChromaDB server port
             embedding_model: Sentence Transformers model name
+            embedding_batch_size: Texts per embedding batch
+            embedding_workers: Processes encoding batches in parallel (1 disables)
+            insert_batch_size: Records per ChromaDB add in add_documents
+            insert_max_workers: Concurrent ChromaDB adds in add_documents (1 runs inline)
+            device: Torch device for the embedding model (defaults to cuda if available)
+            precision: "float16" to run the model in half precision on cuda, or "float32"
+            embedding_cache: EmbeddingCache instance (creates default if None)
         """
         self.collection_name = collection_name
-        self.embedding_model_name = embedding_model
-
-        # Initialize Sentence Transformers model (downloads on first use)
-        print(f"Loading embedding model: {embedding_model}")
-        self.embedding_model = SentenceTransformer(embedding_model)
-        print("✓ Embedding model loaded")
+        self.chromadb_host = chromadb_host
+        self.chromadb_port = chromadb_port
+        self.insert_batch_size = insert_batch_size
+        self.insert_max_workers = insert_max_workers
+        self._init_embeddings(
+            embedding_model,
+            embedding_batch_size,
+            embedding_workers,
+            device=device,
+            precision=precision,
+            embedding_cache=embedding_cache
+        )
 
         # Initialize ChromaDB client
         self.chroma_client = chromadb.HttpClient(
@@ -70,30 +132,257 @@ class VectorStore:
         if not chunks:
             return
 
-        # Extract texts and metadata
-        texts = [chunk["text"] for chunk in chunks]
-        metadatas = [chunk["metadata"] for chunk in chunks]
+        # Embedding and insertion overlap through a bounded queue
+        print(f"Embedding and adding {len(chunks)} chunks...")
+        self._pipeline_add(
+            chunks,
+            embed_batch=self.embedding_batch_size,
+            insert_batch=self.insert_batch_size
+        )
 
-        # Generate embeddings using local model
-        print(f"Generating embeddings for {len(texts)} chunks...")
-        embeddings = self._generate_embeddings(texts)
+        print(f"Successfully indexed {len(chunks)} chunks")
 
-        # Generate unique IDs for each chunk
-        ids = [
-            f"{metadata['source']}_{metadata.get('page', 0)}_{metadata['chunk_index']}"
-            for metadata in metadatas
-        ]
+    async def aadd_documents(self, chunks: List[Dict], max_concurrency: int = 8) -> None:
+        """
+        Add document chunks from async code.
+
+        Chunks are split into insert_batch_size batches that are embedded
+        one at a time (the local model is not safe to share between
+        threads) while up to max_concurrency inserts are in flight on
+        ChromaDB's async client.
 
-        # Add to ChromaDB
-        print(f"Adding {len(texts)} chunks to ChromaDB...")
-        self.collection.add(
-            embeddings=embeddings,
+        Args:
+            chunks: List of chunk dictionaries with 'text' and 'metadata'
+            max_concurrency: Maximum concurrent inserts
+        """
+        if not chunks:
+            return
+
+        print(f"Embedding and adding {len(chunks)} chunks...")
+
+        collection = await self._aget_collection()
+        embed_lock = asyncio.Lock()
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def embed_and_insert(batch: List[Dict]) -> None:
+            texts = [chunk["text"] for chunk in batch]
+            metadatas = [chunk["metadata"] for chunk in batch]
+            ids = self._chunk_ids(metadatas)
+
+            async with embed_lock:
+                embeddings = await self._agenerate_embeddings(texts)
+
+            async with semaphore:
+                if collection is None:
+                    await self.aadd_batch(ids, texts, metadatas, embeddings)
+                else:
+                    await collection.upsert(
+                        ids=ids,
+                        documents=texts,
+                        metadatas=metadatas,
+                        embeddings=embeddings
+                    )
+
+        batch_size = self.insert_batch_size
+        await asyncio.gather(*(
+            embed_and_insert(chunks[i:i + batch_size])
+            for i in range(0, len(chunks), batch_size)
+        ))
+
+        print(f"Successfully indexed {len(chunks)} chunks")
+
+    def _pipeline_add(
+        self,
+        chunks: List[Dict],
+        embed_batch: int = 128,
+        insert_batch: int = 500,
+        queue_depth: int = 4
+    ) -> None:
+        """
+        Embed and insert chunks as a producer/consumer pipeline.
+
+        A producer thread embeds embed_batch chunks at a time (one batch per
+        embedding worker) and queues insert_batch-sized records; consumers
+        insert them as they arrive.
+        The queue is bounded, so at most queue_depth batches wait in memory.
+        With insert_max_workers <= 1 the consumer runs on the calling thread.
+
+        Args:
+            chunks: List of chunk dictionaries with 'text' and 'metadata'
+            embed_batch: Chunks embedded per model call, per embedding worker
+            insert_batch: Records per insert
+            queue_depth: Maximum embedded batches waiting to be inserted
+
+        Raises:
+            RuntimeError: If any batch failed to embed or insert
+        """
+        records: queue.Queue = queue.Queue(maxsize=queue_depth)
+        num_consumers = max(1, self.insert_max_workers)
+        errors = []
+
+        # Give each embedding worker a full batch per model call
+        embed_batch *= max(1, self.embedding_workers)
+
+        def produce() -> None:
+            ids, texts, metadatas, embeddings = [], [], [], []
+            try:
+                for start in range(0, len(chunks), embed_batch):
+                    group = chunks[start:start + embed_batch]
+                    group_texts = [chunk["text"] for chunk in group]
+                    group_metadatas = [chunk["metadata"] for chunk in group]
+
+                    ids.extend(self._chunk_ids(group_metadatas))
+                    texts.extend(group_texts)
+                    metadatas.extend(group_metadatas)
+                    embeddings.extend(self._generate_embeddings(group_texts))
+
+                    while len(ids) >= insert_batch:
+                        records.put((
+                            ids[:insert_batch],
+                            texts[:insert_batch],
+                            metadatas[:insert_batch],
+                            embeddings[:insert_batch]
+                        ))
+                        del ids[:insert_batch], texts[:insert_batch]
+                        del metadatas[:insert_batch], embeddings[:insert_batch]
+
+                if ids:
+                    records.put((ids, texts, metadatas, embeddings))
+            except Exception as e:
+                errors.append(f"embedding: {str(e)}")
+            finally:
+                # One sentinel per consumer signals completion
+                for _ in range(num_consumers):
+                    records.put(None)
+
+        def consume() -> None:
+            while True:
+                record = records.get()
+                if record is None:
+                    return
+                try:
+                    self.add_batch(*record)
+                except Exception as e:
+                    errors.append(f"insert of {len(record[0])} chunks: {str(e)}")
+
+        producer = threading.Thread(target=produce, daemon=True)
+        producer.start()
+
+        if num_consumers == 1:
+            consume()
+        else:
+            consumers = [
+                threading.Thread(target=consume, daemon=True)
+                for _ in range(num_consumers)
+            ]
+            for consumer in consumers:
+                consumer.start()
+            for consumer in consumers:
+                consumer.join()
+
+        producer.join()
+
+        if errors:
+            raise RuntimeError(
+                f"{len(errors)} batch(es) failed: " + "; ".join(errors)
+            )
+
+    @contextmanager
+    def bulk_mode(
+        self,
+        batch_size: int = 10000,
+        sync_threshold: int = 100000
+    ) -> Iterator[None]:
+        """
+        Defer HNSW index maintenance during a bulk ingest.
+
+        Raises the collection's hnsw:batch_size and hnsw:sync_threshold so
+        ChromaDB applies and persists the graph in a few large steps, then
+        restores the previous values. Chroma versions that can't change
+        these on an existing collection ingest normally.
+
+        Args:
+            batch_size: HNSW batch size while in bulk mode
+            sync_threshold: HNSW sync threshold while in bulk mode
+        """
+        previous = self._set_hnsw_params(batch_size=batch_size, sync_threshold=sync_threshold)
+        try:
+            yield
+        finally:
+            if previous:
+                self._set_hnsw_params(**previous)
+
+    def _set_hnsw_params(self, **params: int) -> Optional[Dict[str, int]]:
+        """
+        Update HNSW settings of the existing collection.
+
+        Args:
+            **params: HNSW settings, e.g. batch_size=10000
+
+        Returns:
+            The settings that were replaced, or None if the update failed
+        """
+        try:
+            current = (getattr(self.collection, "configuration", None) or {}).get("hnsw") or {}
+            previous = {
+                name: current.get(name, HNSW_DEFAULTS[name]) for name in params
+            }
+            self.collection.modify(configuration={"hnsw": params})
+        except Exception as e:
+            print(f"Note: HNSW settings unchanged ({e})")
+            return None
+
+        return previous
+
+    def add_batch(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict],
+        embeddings: np.ndarray
+    ) -> None:
+        """
+        Add a pre-embedded batch to ChromaDB in a single request.
+
+        Chunks whose ID already exists are replaced, so re-adding
+        unchanged content is an idempotent upsert.
+
+        Args:
+            ids: Unique chunk IDs
+            texts: Chunk texts
+            metadatas: Chunk metadata dictionaries
+            embeddings: Embedding vectors, one per chunk
+        """
+        if not ids:
+            return
+
+        self.collection.upsert(
+            ids=ids,
             documents=texts,
             metadatas=metadatas,
-            ids=ids
+            embeddings=embeddings
         )
 
-        print(f"Successfully indexed {len(texts)} chunks")
+    async def aadd_batch(
+        self,
+        ids: List[str],
+        texts: List[str],
+        metadatas: List[Dict],
+        embeddings: np.ndarray
+    ) -> None:
+        """
+        Add a pre-embedded batch without blocking the event loop.
+
+        The insert runs on a worker thread so it can overlap with
+        embedding the next batch.
+
+        Args:
+            ids: Unique chunk IDs
+            texts: Chunk texts
+            metadatas: Chunk metadata dictionaries
+            embeddings: Embedding vectors, one per chunk
+        """
+        await asyncio.to_thread(self.add_batch, ids, texts, metadatas, embeddings)
 
     def search(
         self,
@@ -112,8 +401,8 @@ class VectorStore:
         Returns:
             List of results with text, metadata, and similarity score
         """
-        # Generate query embedding
-        query_embedding = self._generate_embeddings([query])[0]
+        # Embed the query directly; queries are not worth a cache entry
+        query_embedding = self._encode([query])[0]
 
         # Search in ChromaDB
         results = self.collection.query(
@@ -159,6 +448,36 @@ class VectorStore:
         )
         print(f"Deleted all chunks with hash: {file_hash}")
 
+    def delete_by_hashes(self, file_hashes: List[str]) -> None:
+        """
+        Delete all chunks matching any of several file hashes in one request.
+
+        Args:
+            file_hashes: File hashes to delete
+        """
+        if not file_hashes:
+            return
+
+        self.collection.delete(
+            where={"file_hash": {"$in": list(file_hashes)}}
+        )
+        print(f"Deleted all chunks for {len(file_hashes)} file hash(es)")
+
+    def delete_by_file_paths(self, file_paths: List[str]) -> None:
+        """
+        Delete all chunks of several files in one request.
+
+        Args:
+            file_paths: Absolute file paths, as stored in chunk metadata
+        """
+        if not file_paths:
+            return
+
+        self.collection.delete(
+            where={"file_path": {"$in": list(file_paths)}}
+        )
+        print(f"Deleted all chunks for {len(file_paths)} file(s)")
+
     def get_collection_stats(self) -> Dict:
         """
         Get statistics about the collection.
@@ -189,25 +508,317 @@ class VectorStore:
 
         print(f"Cleared collection: {self.collection_name}")
 
-    def _generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    async def aembed_documents(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        max_concurrency: int = 1
+    ) -> np.ndarray:
+        """
+        Generate embeddings off the event loop in length-sorted sub-batches.
+
+        Texts are sorted by length so each sub-batch pads to a similar size,
+        and results are returned in the original order. The local model's
+        tokenizer is not safe to call from several threads at once, so
+        sub-batches run one at a time by default.
+
+        Args:
+            texts: List of texts to embed
+            batch_size: Texts per sub-batch (defaults to embedding_batch_size)
+            max_concurrency: Maximum sub-batches embedded at the same time
+
+        Returns:
+            Array of embedding vectors (n, d), aligned with texts
+        """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        batch_size = batch_size or self.embedding_batch_size
+
+        # Longest first, remembering each text's original position
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]), reverse=True)
+        batches = [order[i:i + batch_size] for i in range(0, len(order), batch_size)]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def _embed(batch: List[int]) -> np.ndarray:
+            async with semaphore:
+                return await self._agenerate_embeddings([texts[i] for i in batch])
+
+        results = await asyncio.gather(*(_embed(batch) for batch in batches))
+
+        # Undo the length sort
+        embeddings = np.empty((len(texts), results[0].shape[1]), dtype=results[0].dtype)
+        for batch, batch_embeddings in zip(batches, results):
+            embeddings[batch] = batch_embeddings
+
+        return embeddings
+
+    def close(self) -> None:
+        """
+        Stop the embedding worker pool, if one was started.
+        """
+        if self._embedding_pool is not None:
+            self.embedding_model.stop_multi_process_pool(self._embedding_pool)
+            self._embedding_pool = None
+
+    def _init_embeddings(
+        self,
+        embedding_model: str,
+        embedding_batch_size: int,
+        embedding_workers: int,
+        device: Optional[str] = None,
+        precision: str = "float16",
+        embedding_cache: Optional[EmbeddingCache] = None
+    ) -> None:
+        """
+        Load the embedding model and store batching settings.
+
+        Half precision is only applied on cuda; fp16 matmuls on CPU are
+        slower than fp32.
+
+        Args:
+            embedding_model: Sentence Transformers model name
+            embedding_batch_size: Texts per embedding batch
+            embedding_workers: Processes encoding batches in parallel
+            device: Torch device (defaults to cuda if available, else cpu)
+            precision: "float16" or "float32"
+            embedding_cache: EmbeddingCache instance (creates default if None)
+        """
+        if precision not in ("float16", "float32"):
+            raise ValueError(f"Unsupported precision: {precision}")
+
+        self.embedding_model_name = embedding_model
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_workers = embedding_workers
+        self.embedding_token_budget = DEFAULT_EMBED_TOKEN_BUDGET
+        self.embedding_cache = embedding_cache or EmbeddingCache()
+        self._embedding_pool = None
+
+        if device is None:
+            import torch  # installed with sentence-transformers
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+        self.device = device
+
+        # Initialize Sentence Transformers model (downloads on first use)
+        self.embedding_model = _load_st_model(
+            embedding_model,
+            device,
+            precision == "float16" and device.startswith("cuda")
+        )
+
+    def _get_embedding_pool(self) -> Dict:
+        """
+        Start the Sentence Transformers multi-process pool on first use.
+
+        Each worker holds its own copy of the model, so batches encode in
+        parallel without sharing a tokenizer.
+
+        Returns:
+            Pool handle for encode_multi_process
+        """
+        if self._embedding_pool is None:
+            print(f"Starting {self.embedding_workers} embedding workers...")
+            self._embedding_pool = self.embedding_model.start_multi_process_pool(
+                target_devices=[self.device] * self.embedding_workers
+            )
+            atexit.register(self.close)
+
+        return self._embedding_pool
+
+    def _chunk_ids(self, metadatas: List[Dict]) -> List[str]:
+        """
+        Build ChromaDB IDs for a list of chunk metadata dictionaries.
+
+        IDs combine the file hash with a short digest of the file path:
+        re-indexing unchanged content reproduces the same IDs, while
+        identical copies of a file keep separate rows (and their own
+        source metadata) that can be deleted independently.
+
+        Args:
+            metadatas: Chunk metadata dictionaries
+
+        Returns:
+            List of chunk IDs
+        """
+        # Chunks arrive grouped by file, so each path is digested once
+        path_digests = {}
+        for metadata in metadatas:
+            file_path = metadata["file_path"]
+            if file_path not in path_digests:
+                path_digests[file_path] = hashlib.blake2b(
+                    file_path.encode("utf-8"), digest_size=8
+                ).hexdigest()
+
+        # One pass over the dicts; extracting columns first (or into numpy
+        # arrays) only adds passes and is measurably slower
+        return [
+            f"{metadata['file_hash']}_{path_digests[metadata['file_path']]}_"
+            f"{metadata.get('page', 0)}_{metadata['chunk_index']}"
+            for metadata in metadatas
+        ]
+
+    async def _aget_collection(self):
+        """
+        Open the collection on ChromaDB's async HTTP client.
+
+        The client is bound to the running event loop, so it is created
+        per call rather than cached.
+
+        Returns:
+            Async collection, or None if this chromadb has no async client
+        """
+        if not hasattr(chromadb, "AsyncHttpClient"):
+            return None
+
+        client = await chromadb.AsyncHttpClient(
+            host=self.chromadb_host,
+            port=self.chromadb_port
+        )
+        return await client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={"description": "Note2Agent document embeddings"}
+        )
+
+    async def _agenerate_embeddings(self, texts: List[str]) -> np.ndarray:
+        """
+        Generate embeddings on a worker thread so the event loop stays free.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Array of unit-length embedding vectors, shape (n, d)
+        """
+        return await asyncio.to_thread(self._generate_embeddings, texts)
+
+    def _token_budget_batches(self, texts: List[str]) -> List[List[int]]:
+        """
+        Group text indices into batches of similar token length.
+
+        Texts are sorted longest first and packed greedily until the
+        padded size (longest text x batch length) would exceed the token
+        budget, so short chunks batch wide and long chunks batch narrow.
+
+        Args:
+            texts: Texts to be embedded
+
+        Returns:
+            Lists of indices into texts, one per encode call
+        """
+        max_len = self.embedding_model.max_seq_length or 512
+        lengths = [
+            min(length, max_len)
+            for length in self.embedding_model.tokenizer(
+                texts,
+                truncation=False,
+                padding=False,
+                return_length=True
+            )["length"]
+        ]
+        order = sorted(range(len(texts)), key=lambda i: lengths[i], reverse=True)
+
+        batches = []
+        batch = []
+        batch_len = 0  # longest text in the batch, which sets its padding
+        for i in order:
+            padded = max(batch_len, lengths[i]) * (len(batch) + 1)
+            if batch and padded > self.embedding_token_budget:
+                batches.append(batch)
+                batch = []
+                batch_len = 0
+            batch.append(i)
+            batch_len = max(batch_len, lengths[i])
+        if batch:
+            batches.append(batch)
+
+        return batches
+
+    def _generate_embeddings(self, texts: List[str]) -> np.ndarray:
         """
         Generate embeddings using local Sentence Transformers model.
 
+        Texts already in the embedding cache are not re-embedded. The
+        array is passed to ChromaDB as-is rather than converted to
+        nested Python lists.
+
         Args:
             texts: List of texts to embed
 
         Returns:
-            List of embedding vectors
+            Array of unit-length embedding vectors, shape (n, d)
         """
-        # Generate embeddings (handles batching automatically)
-        embeddings = self.embedding_model.encode(
-            texts,
-            show_progress_bar=True,
-            convert_to_numpy=True
+        keys = [EmbeddingCache.key(text) for text in texts]
+        cached = self.embedding_cache.get_many(keys, self.embedding_model_name)
+
+        misses = [i for i, key in enumerate(keys) if key not in cached]
+        if not cached:
+            embeddings = self._encode(texts)
+        else:
+            dimensions = self.embedding_model.get_sentence_embedding_dimension()
+            embeddings = np.empty((len(texts), dimensions), dtype=np.float32)
+            for i, key in enumerate(keys):
+                if key in cached:
+                    embeddings[i] = cached[key]
+            if misses:
+                embeddings[misses] = self._encode([texts[i] for i in misses])
+
+        self.embedding_cache.put_many(
+            ((keys[i], embeddings[i]) for i in misses),
+            self.embedding_model_name
         )
 
-        # Convert numpy arrays to lists
-        return embeddings.tolist()
+        return embeddings
+
+    def _encode(self, texts: List[str]) -> np.ndarray:
+        """
+        Run the embedding model over texts.
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            Array of unit-length embedding vectors, shape (n, d)
+        """
+        if not texts:
+            dimensions = self.embedding_model.get_sentence_embedding_dimension()
+            return np.empty((0, dimensions), dtype=np.float32)
+
+        if self.embedding_workers > 1 and len(texts) >= self.embedding_workers:
+            # Split evenly so every worker gets a share; output keeps input order
+            embeddings = self.embedding_model.encode_multi_process(
+                texts,
+                self._get_embedding_pool(),
+                batch_size=self.embedding_batch_size,
+                chunk_size=-(-len(texts) // self.embedding_workers)
+            )
+        else:
+            # Encode token-budget batches, then restore the input order
+            embeddings = None
+            for batch in self._token_budget_batches(texts):
+                batch_embeddings = self.embedding_model.encode(
+                    [texts[i] for i in batch],
+                    batch_size=len(batch),
+                    show_progress_bar=False,
+                    convert_to_numpy=True,
+                    device=self.device
+                )
+                if embeddings is None:
+                    embeddings = np.empty(
+                        (len(texts), batch_embeddings.shape[1]),
+                        dtype=batch_embeddings.dtype
+                    )
+                embeddings[batch] = batch_embeddings
+
+        # A half-precision model returns float16; store and compare in float32
+        embeddings = embeddings.astype(np.float32, copy=False)
+
+        # Normalize in place so both encode paths return unit vectors
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        embeddings /= norms
+
+        return embeddings
 
     def health_check(self) -> bool:
         """
@@ -230,7 +841,12 @@ def create_vector_store(
     collection_name: str = "note2agent_docs",
     chromadb_host: str = "localhost",
     chromadb_port: int = 8000,
-    embedding_model: str = "BAAI/bge-small-en-v1.5"
+    embedding_model: str = "BAAI/bge-small-en-v1.5",
+    embedding_batch_size: int = 128,
+    embedding_workers: int = 1,
+    device: Optional[str] = None,
+    precision: str = "float16",
+    embedding_cache: Optional[EmbeddingCache] = None
 ) -> VectorStore:
     """
     Factory function to create a vector store instance.
@@ -240,6 +856,11 @@ def create_vector_store(
         chromadb_host: ChromaDB server host
         chromadb_port: ChromaDB server port
         embedding_model: Sentence Transformers model name
+        embedding_batch_size: Texts per embedding batch
+        embedding_workers: Processes encoding batches in parallel (1 disables)
+        device: Torch device for the embedding model (defaults to cuda if available)
+        precision: "float16" to run the model in half precision on cuda, or "float32"
+        embedding_cache: EmbeddingCache instance (creates default if None)
 
     Returns:
         Initialized VectorStore instance
@@ -248,7 +869,12 @@ def create_vector_store(
         collection_name=collection_name,
         chromadb_host=chromadb_host,
         chromadb_port=chromadb_port,
-        embedding_model=embedding_model
+        embedding_model=embedding_model,
+        embedding_batch_size=embedding_batch_size,
+        embedding_workers=embedding_workers,
+        device=device,
+        precision=precision,
+        embedding_cache=embedding_cache
     )
 
 